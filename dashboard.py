@@ -2,17 +2,28 @@
 WiFi Auto Auth Dashboard - Web-based monitoring interface for WiFi login attempts
 """
 
-import sqlite3
+import asyncio
 import json
 import os
+import sys
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from fastapi import FastAPI, Request, Depends, HTTPException, status, Form
+from functools import lru_cache
+from typing import AsyncIterator, List, Dict, Optional, Tuple
+import aiosqlite
+import anyio
+import orjson
+from aiosqlitepool import SQLiteConnectionPool
+from fastapi import FastAPI, Request, Depends, HTTPException, Query, status, Form
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse, StreamingResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from pydantic import BaseModel
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache
+from pydantic import BaseModel, ConfigDict
 import uvicorn
 import secrets
 from pathlib import Path
@@ -30,45 +41,57 @@ except ImportError:
 CONFIG_PATH = "config.json"
 DB_NAME = "wifi_log.db"
 
+# Upper bound for /api/attempts and how many rows each streamed fetch pulls
+MAX_ATTEMPTS_LIMIT = 10000
+STREAM_BATCH_SIZE = 256
+
+# Per-connection tuning for pooled dashboard connections, which only ever read
+DB_READ_PRAGMAS = """
+    PRAGMA busy_timeout=5000;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+    PRAGMA query_only=1;
+"""
+
+# Used when config.json is missing, invalid or has no "dashboard" section
+DEFAULT_CONFIG = {
+    "host": "127.0.0.1",
+    "port": 8000,
+    "username": "admin",
+    "password": "admin123",
+    "secret_key": secrets.token_urlsafe(32),
+    "pool_size": 5,
+    "stream_pool_size": 2
+}
+
 # Load configuration
+@lru_cache(maxsize=1)
 def load_dashboard_config():
     """Load dashboard configuration from config.json"""
-    if not os.path.exists(CONFIG_PATH):
+    try:
+        data = Path(CONFIG_PATH).read_bytes()
+    except FileNotFoundError:
         # Use default configuration if config.json doesn't exist
-        return {
-            "host": "127.0.0.1",
-            "port": 8000,
-            "username": "admin",
-            "password": "admin123",
-            "secret_key": secrets.token_urlsafe(32)
-        }
+        return DEFAULT_CONFIG
     
     try:
-        with open(CONFIG_PATH, "r") as f:
-            config = json.load(f)
-        
-        return config.get("dashboard", {
-            "host": "127.0.0.1",
-            "port": 8000,
-            "username": "admin",
-            "password": "admin123",
-            "secret_key": secrets.token_urlsafe(32)
-        })
-    except (json.JSONDecodeError, KeyError):
+        return json.loads(data).get("dashboard", DEFAULT_CONFIG)
+    except (json.JSONDecodeError, AttributeError):
         logger.warning("Invalid config.json, using default dashboard configuration")
-        return {
-            "host": "127.0.0.1",
-            "port": 8000,
-            "username": "admin",
-            "password": "admin123",
-            "secret_key": secrets.token_urlsafe(32)
-        }
+        return DEFAULT_CONFIG
 
 # Dashboard configuration
 DASHBOARD_CONFIG = load_dashboard_config()
 
+# Expected credentials, encoded once for constant-time comparison
+EXPECTED_USERNAME = DASHBOARD_CONFIG["username"].encode()
+EXPECTED_PASSWORD = DASHBOARD_CONFIG["password"].encode()
+
 # --- PYDANTIC MODELS ---
 class LoginAttempt(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     id: int
     timestamp: str
     username: str
@@ -90,7 +113,32 @@ class FilterParams(BaseModel):
     limit: int = 50
 
 # --- FASTAPI APP SETUP ---
-app = FastAPI(title="WiFi Auto Auth Dashboard", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Bootstrap the database once and keep the connection pools for the app's lifetime"""
+    global db_pool, stream_pool
+    await init_db()
+    FastAPICache.init(InMemoryBackend(), prefix="dash")
+    # Each aiosqlite connection runs on its own thread, so the pool size also
+    # bounds how many queries run concurrently off the event loop
+    pool_size = DASHBOARD_CONFIG.get("pool_size", DEFAULT_CONFIG["pool_size"])
+    db_pool = SQLiteConnectionPool(connection_factory=create_db_connection, pool_size=pool_size)
+    await warm_db_pool(db_pool, pool_size)
+    # Streamed /api/attempts responses get their own small pool, so slow clients
+    # cannot starve the page and stats queries of connections
+    stream_pool_size = DASHBOARD_CONFIG.get("stream_pool_size", DEFAULT_CONFIG["stream_pool_size"])
+    stream_pool = SQLiteConnectionPool(connection_factory=create_db_connection, pool_size=stream_pool_size)
+    await warm_db_pool(stream_pool, stream_pool_size)
+    yield
+    await stream_pool.close()
+    await db_pool.close()
+
+app = FastAPI(
+    title="WiFi Auto Auth Dashboard",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
 
 # Setup templates and static files
 templates = Jinja2Templates(directory="templates")
@@ -106,8 +154,8 @@ security = HTTPBasic()
 
 def authenticate(credentials: HTTPBasicCredentials = Depends(security)):
     """Simple HTTP Basic Authentication"""
-    correct_username = secrets.compare_digest(credentials.username, DASHBOARD_CONFIG["username"])
-    correct_password = secrets.compare_digest(credentials.password, DASHBOARD_CONFIG["password"])
+    correct_username = secrets.compare_digest(credentials.username.encode(), EXPECTED_USERNAME)
+    correct_password = secrets.compare_digest(credentials.password.encode(), EXPECTED_PASSWORD)
     
     if not (correct_username and correct_password):
         raise HTTPException(
@@ -118,99 +166,271 @@ def authenticate(credentials: HTTPBasicCredentials = Depends(security)):
     return credentials.username
 
 # --- DATABASE FUNCTIONS ---
-def get_db_connection():
-    """Get database connection"""
+# Connection pools created in the app lifespan: one shared by the page and
+# stats queries, one reserved for streamed /api/attempts responses
+db_pool: Optional[SQLiteConnectionPool] = None
+stream_pool: Optional[SQLiteConnectionPool] = None
+
+# Set once the schema bootstrap has run in this process
+db_ready = False
+
+# Schema, indexes and rollups; run in one transaction so the rollup seed
+# cannot miss rows written by the auth script before the triggers exist
+DB_SCHEMA = """
+    -- Several workers may bootstrap at once; wait for each other's locks
+    PRAGMA busy_timeout=5000;
+
+    -- WAL is persistent, so readers no longer block on the auth script's writes
+    PRAGMA journal_mode=WAL;
+
+    BEGIN IMMEDIATE;
+
+    CREATE TABLE IF NOT EXISTS login_attempts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT,
+        username TEXT,
+        password TEXT,
+        a TEXT,
+        response_status TEXT,
+        response_message TEXT
+    );
+
+    -- Dashboard queries filter on status and sort or range-scan on timestamp
+    CREATE INDEX IF NOT EXISTS idx_attempts_ts ON login_attempts(timestamp DESC);
+    CREATE INDEX IF NOT EXISTS idx_attempts_status_ts ON login_attempts(response_status, timestamp DESC);
+
+    -- Single-row counters backing get_dashboard_stats
+    CREATE TABLE IF NOT EXISTS stats_rollup (
+        total INTEGER NOT NULL,
+        successful INTEGER NOT NULL,
+        last_ts TEXT
+    );
+
+    INSERT INTO stats_rollup (total, successful, last_ts)
+    SELECT * FROM (
+        SELECT COUNT(*), COALESCE(SUM(response_status IS '200'), 0), MAX(timestamp)
+        FROM login_attempts
+    )
+    WHERE NOT EXISTS (SELECT 1 FROM stats_rollup);
+
+    CREATE TRIGGER IF NOT EXISTS trg_attempts_ins AFTER INSERT ON login_attempts
+    BEGIN
+        UPDATE stats_rollup SET
+            total = total + 1,
+            successful = successful + (NEW.response_status IS '200'),
+            last_ts = NULLIF(MAX(COALESCE(last_ts, ''), COALESCE(NEW.timestamp, '')), '');
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_attempts_del AFTER DELETE ON login_attempts
+    BEGIN
+        UPDATE stats_rollup SET
+            total = total - 1,
+            successful = successful - (OLD.response_status IS '200'),
+            last_ts = (SELECT MAX(timestamp) FROM login_attempts);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_attempts_upd AFTER UPDATE OF response_status, timestamp ON login_attempts
+    BEGIN
+        UPDATE stats_rollup SET
+            successful = successful - (OLD.response_status IS '200') + (NEW.response_status IS '200'),
+            last_ts = (SELECT MAX(timestamp) FROM login_attempts);
+    END;
+
+    -- Per-hour counters backing get_hourly_stats
+    CREATE TABLE IF NOT EXISTS hourly_stats (
+        hour TEXT PRIMARY KEY,
+        total INTEGER NOT NULL,
+        successful INTEGER NOT NULL
+    );
+
+    INSERT INTO hourly_stats (hour, total, successful)
+    SELECT strftime('%Y-%m-%d %H', timestamp) AS hour, COUNT(*), COALESCE(SUM(response_status IS '200'), 0)
+    FROM login_attempts
+    WHERE hour IS NOT NULL AND NOT EXISTS (SELECT 1 FROM hourly_stats)
+    GROUP BY hour;
+
+    CREATE TRIGGER IF NOT EXISTS trg_hour_ins AFTER INSERT ON login_attempts
+    WHEN strftime('%Y-%m-%d %H', NEW.timestamp) IS NOT NULL
+    BEGIN
+        INSERT INTO hourly_stats (hour, total, successful)
+        VALUES (strftime('%Y-%m-%d %H', NEW.timestamp), 1, NEW.response_status IS '200')
+        ON CONFLICT(hour) DO UPDATE SET
+            total = total + 1,
+            successful = successful + (NEW.response_status IS '200');
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_hour_del AFTER DELETE ON login_attempts
+    WHEN strftime('%Y-%m-%d %H', OLD.timestamp) IS NOT NULL
+    BEGIN
+        UPDATE hourly_stats SET
+            total = total - 1,
+            successful = successful - (OLD.response_status IS '200')
+        WHERE hour = strftime('%Y-%m-%d %H', OLD.timestamp);
+        DELETE FROM hourly_stats WHERE hour = strftime('%Y-%m-%d %H', OLD.timestamp) AND total <= 0;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_hour_upd AFTER UPDATE OF response_status, timestamp ON login_attempts
+    BEGIN
+        UPDATE hourly_stats SET
+            total = total - 1,
+            successful = successful - (OLD.response_status IS '200')
+        WHERE hour = strftime('%Y-%m-%d %H', OLD.timestamp);
+        DELETE FROM hourly_stats WHERE hour = strftime('%Y-%m-%d %H', OLD.timestamp) AND total <= 0;
+        INSERT INTO hourly_stats (hour, total, successful)
+        SELECT strftime('%Y-%m-%d %H', NEW.timestamp), 1, NEW.response_status IS '200'
+        WHERE strftime('%Y-%m-%d %H', NEW.timestamp) IS NOT NULL
+        ON CONFLICT(hour) DO UPDATE SET
+            total = total + 1,
+            successful = successful + (NEW.response_status IS '200');
+    END;
+
+    COMMIT;
+
+    -- Sampled ANALYZE: bounded work, so planner statistics can be refreshed on
+    -- every start without holding the write lock long enough to block writers
+    PRAGMA analysis_limit=1000;
+    ANALYZE login_attempts;
+"""
+
+async def init_db():
+    """Create the database, table structure, indexes and rollups if they do not exist"""
+    global db_ready
+    if db_ready:
+        return
+    
     if not os.path.exists(DB_NAME):
         logger.warning(f"Database {DB_NAME} not found. Creating empty database.")
-        # Create an empty database with the required table structure
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS login_attempts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT,
-                username TEXT,
-                password TEXT,
-                a TEXT,
-                response_status TEXT,
-                response_message TEXT
-            )
-        """)
-        conn.commit()
-        return conn
-    
-    return sqlite3.connect(DB_NAME)
-
-def get_login_attempts(filters: FilterParams) -> List[Dict]:
-    """Get login attempts with filters"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
     
-    query = """
+    async with aiosqlite.connect(DB_NAME) as conn:
+        await conn.executescript(DB_SCHEMA)
+    
+    db_ready = True
+
+async def create_db_connection() -> aiosqlite.Connection:
+    """Open a new pooled connection; PRAGMAs run once per physical connection"""
+    # Read-only open: the dashboard never writes, so SQLite can skip write locking
+    conn = await aiosqlite.connect(f"file:{DB_NAME}?mode=ro", uri=True)
+    conn.row_factory = aiosqlite.Row
+    await conn.executescript(DB_READ_PRAGMAS)
+    return conn
+
+def build_attempts_query(has_start: bool, has_end: bool, status_filter: Optional[str]) -> str:
+    """Build the login attempts query for one combination of filters"""
+    conditions = []
+    
+    if has_start:
+        conditions.append("timestamp >= :start")
+    
+    if has_end:
+        conditions.append("timestamp <= :end")
+    
+    if status_filter == "success":
+        conditions.append("response_status = '200'")
+    elif status_filter == "failed":
+        conditions.append("response_status != '200'")
+    
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    
+    return f"""
         SELECT id, timestamp, username, a, response_status, response_message 
         FROM login_attempts 
-        WHERE 1=1
+        {where}
+        ORDER BY timestamp DESC LIMIT :lim
     """
-    params = []
-    
-    if filters.start_date:
-        query += " AND timestamp >= ?"
-        params.append(filters.start_date)
-    
-    if filters.end_date:
-        query += " AND timestamp <= ?"
-        params.append(filters.end_date)
-    
-    if filters.status_filter:
-        if filters.status_filter == "success":
-            query += " AND response_status = '200'"
-        elif filters.status_filter == "failed":
-            query += " AND response_status != '200'"
-    
-    query += " ORDER BY timestamp DESC LIMIT ?"
-    params.append(filters.limit)
-    
-    cursor.execute(query, params)
-    rows = cursor.fetchall()
-    conn.close()
-    
-    return [
-        {
-            "id": row[0],
-            "timestamp": row[1],
-            "username": row[2],
-            "a": row[3],
-            "response_status": row[4],
-            "response_message": row[5]
-        }
-        for row in rows
-    ]
-
-def get_dashboard_stats() -> DashboardStats:
-    """Get dashboard statistics"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+
+# Every filter combination maps to one fixed SQL string, so the driver's
+# statement cache reuses compiled statements instead of re-preparing them
+ATTEMPTS_QUERIES = {
+    (has_start, has_end, status_filter): build_attempts_query(has_start, has_end, status_filter)
+    for has_start in (False, True)
+    for has_end in (False, True)
+    for status_filter in (None, "success", "failed")
+}
+
+def login_attempts_query(filters: FilterParams) -> Tuple[str, Dict]:
+    """Pick the precomputed query for the given filters and its named parameters"""
+    status_filter = filters.status_filter if filters.status_filter in ("success", "failed") else None
+    query = ATTEMPTS_QUERIES[(bool(filters.start_date), bool(filters.end_date), status_filter)]
+    
+    return query, {"start": filters.start_date, "end": filters.end_date, "lim": filters.limit}
+
+# Homepage queries run on every pooled connection at startup
+WARMUP_QUERIES = [
+    ("SELECT total, successful, last_ts FROM stats_rollup", ()),
+    (ATTEMPTS_QUERIES[(False, False, None)], {"start": None, "end": None, "lim": 10}),
+]
+
+async def warm_db_pool(pool: SQLiteConnectionPool, pool_size: int):
+    """Open every pooled connection and prepare the homepage queries before the first request"""
+    async with AsyncExitStack() as stack:
+        # Hold all connections at once so the pool has to open each of them
+        connections = [await stack.enter_async_context(pool.connection()) for _ in range(pool_size)]
+        for conn in connections:
+            for query, params in WARMUP_QUERIES:
+                cursor = await conn.execute(query, params)
+                await cursor.fetchall()
+    
+    logger.info(f"Warmed {pool_size} database connections")
+
+async def get_login_attempts(filters: FilterParams) -> List[LoginAttempt]:
+    """Get login attempts with filters"""
+    query, params = login_attempts_query(filters)
+    
+    async with db_pool.connection() as conn:
+        cursor = await conn.execute(query, params)
+        rows = await cursor.fetchall()
     
-    # Total attempts
-    cursor.execute("SELECT COUNT(*) FROM login_attempts")
-    total_attempts = cursor.fetchone()[0]
+    # Rows already have the model's shape, so skip validation
+    return [LoginAttempt.model_construct(**row) for row in rows]
+
+async def open_login_attempts_cursor(filters: FilterParams) -> Tuple[AsyncExitStack, aiosqlite.Cursor]:
+    """Run the login attempts query on a stream pool connection and return its open cursor"""
+    query, params = login_attempts_query(filters)
+    
+    # The stack holds the pool checkout until the stream finishes and closes it
+    stack = AsyncExitStack()
+    conn = await stack.enter_async_context(stream_pool.connection())
+    try:
+        cursor = await conn.execute(query, params)
+    except BaseException:
+        await stack.aclose()
+        raise
     
-    # Successful attempts (assuming 200 is success)
-    cursor.execute("SELECT COUNT(*) FROM login_attempts WHERE response_status = '200'")
-    successful_attempts = cursor.fetchone()[0]
+    cursor.arraysize = STREAM_BATCH_SIZE
+    return stack, cursor
+
+async def get_dashboard_stats() -> DashboardStats:
+    """Get dashboard statistics"""
+    async with db_pool.connection() as conn:
+        # Counters are maintained by triggers on login_attempts
+        cursor = await conn.execute("SELECT total, successful, last_ts FROM stats_rollup")
+        row = await cursor.fetchone()
+        
+        if row is None:
+            # Rollup row was removed out from under us; fall back to one aggregate pass
+            cursor = await conn.execute("""
+                SELECT COUNT(*), COALESCE(SUM(CASE WHEN response_status = '200' THEN 1 ELSE 0 END), 0), MAX(timestamp)
+                FROM login_attempts
+            """)
+            row = await cursor.fetchone()
+        
+        total_attempts, successful_attempts, last_attempt = row
+    
+    # Nothing logged yet (common on first boot)
+    if total_attempts == 0:
+        return DashboardStats(
+            total_attempts=0,
+            successful_attempts=0,
+            failed_attempts=0,
+            success_rate=0.0,
+            last_attempt=None
+        )
     
     # Failed attempts
     failed_attempts = total_attempts - successful_attempts
     
     # Success rate
-    success_rate = (successful_attempts / total_attempts * 100) if total_attempts > 0 else 0
-    
-    # Last attempt
-    cursor.execute("SELECT timestamp FROM login_attempts ORDER BY timestamp DESC LIMIT 1")
-    last_attempt_row = cursor.fetchone()
-    last_attempt = last_attempt_row[0] if last_attempt_row else None
-    
-    conn.close()
+    success_rate = successful_attempts / total_attempts * 100
     
     return DashboardStats(
         total_attempts=total_attempts,
@@ -220,64 +440,100 @@ def get_dashboard_stats() -> DashboardStats:
         last_attempt=last_attempt
     )
 
-def get_hourly_stats(days: int = 7) -> List[Dict]:
+@lru_cache(maxsize=8)
+def hourly_stats_start(days: int, now_second: int) -> str:
+    """First hour bucket in the window; recomputed at most once per second per window size"""
+    start_date = datetime.fromtimestamp(now_second) - timedelta(days=days)
+    return start_date.strftime('%Y-%m-%d %H')
+
+async def get_hourly_stats(days: int = 7) -> List[Dict]:
     """Get hourly login attempt statistics for the last N days"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    start_date = datetime.now() - timedelta(days=days)
+    start_hour = hourly_stats_start(days, int(time.time()))
     
+    # Buckets are maintained by triggers on login_attempts
     query = """
-        SELECT 
-            strftime('%Y-%m-%d %H', timestamp) as hour,
-            COUNT(*) as total_attempts,
-            SUM(CASE WHEN response_status = '200' THEN 1 ELSE 0 END) as successful_attempts
-        FROM login_attempts 
-        WHERE timestamp >= ?
-        GROUP BY strftime('%Y-%m-%d %H', timestamp)
+        SELECT
+            hour,
+            total AS total_attempts,
+            successful AS successful_attempts,
+            total - successful AS failed_attempts
+        FROM hourly_stats
+        WHERE hour >= ?
         ORDER BY hour
     """
     
-    cursor.execute(query, (start_date.isoformat(),))
-    rows = cursor.fetchall()
-    conn.close()
+    async with db_pool.connection() as conn:
+        cursor = await conn.execute(query, (start_hour,))
+        rows = await cursor.fetchall()
     
-    return [
-        {
-            "hour": row[0],
-            "total_attempts": row[1],
-            "successful_attempts": row[2],
-            "failed_attempts": row[1] - row[2]
-        }
-        for row in rows
-    ]
+    return [dict(row) for row in rows]
+
+# --- RESPONSE STREAMING ---
+async def stream_attempts_json(stack: AsyncExitStack, cursor: aiosqlite.Cursor) -> AsyncIterator[bytes]:
+    """Encode rows from an open cursor as a {"attempts": [...]} document, one row per chunk"""
+    count = 0
+    try:
+        yield b'{"attempts":['
+        async for row in cursor:
+            yield (b"," if count else b"") + orjson.dumps(dict(row))
+            count += 1
+        yield b"]}"
+    finally:
+        # Also runs when the client disconnects mid-stream; shield the release from cancellation
+        with anyio.CancelScope(shield=True):
+            await cursor.close()
+            await stack.aclose()
+    
+    logger.info(f"API call: Retrieved {count} login attempts")
+
+# --- RESPONSE CACHING ---
+def hourly_stats_key_builder(func, namespace: str = "", *, request=None, response=None, args=(), kwargs=None):
+    """Key hourly stats on the window size only; the payload is the same for every user"""
+    return f"{namespace}:hourly:{kwargs['days']}"
+
+# --- PAGE RENDERING ---
+# Last rendered dashboard page per user, with the key of the data it shows
+dashboard_html_cache: Dict[str, Tuple[tuple, str]] = {}
+
+def render_dashboard(username: str, stats: DashboardStats, recent_attempts: List[LoginAttempt]) -> str:
+    """Render the dashboard page, reusing the previous render while its data is unchanged"""
+    cache_key = (
+        stats.total_attempts,
+        stats.successful_attempts,
+        stats.last_attempt,
+        tuple(attempt.id for attempt in recent_attempts)
+    )
+    
+    cached = dashboard_html_cache.get(username)
+    if cached and cached[0] == cache_key:
+        return cached[1]
+    
+    html = templates.get_template("dashboard.html").render(
+        recent_attempts=recent_attempts,
+        stats=stats,
+        username=username
+    )
+    dashboard_html_cache[username] = (cache_key, html)
+    return html
 
 # --- ROUTES ---
 @app.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request, username: str = Depends(authenticate)):
+async def dashboard(username: str = Depends(authenticate)):
     """Main dashboard page"""
     logger.info(f"Dashboard accessed by user: {username}")
     
-    # Get recent login attempts
+    # Get recent login attempts and statistics concurrently
     filters = FilterParams(limit=10)
-    recent_attempts = get_login_attempts(filters)
-    
-    # Get statistics
-    stats = get_dashboard_stats()
+    recent_attempts, stats = await asyncio.gather(get_login_attempts(filters), get_dashboard_stats())
     
-    return templates.TemplateResponse("dashboard.html", {
-        "request": request,
-        "recent_attempts": recent_attempts,
-        "stats": stats,
-        "username": username
-    })
+    return HTMLResponse(render_dashboard(username, stats, recent_attempts))
 
 @app.get("/api/attempts")
 async def get_attempts_api(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     status_filter: Optional[str] = None,
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=MAX_ATTEMPTS_LIMIT),
     username: str = Depends(authenticate)
 ):
     """API endpoint to get login attempts with filters"""
@@ -288,22 +544,24 @@ async def get_attempts_api(
         limit=limit
     )
     
-    attempts = get_login_attempts(filters)
-    logger.info(f"API call: Retrieved {len(attempts)} login attempts")
-    
-    return {"attempts": attempts}
+    # Run the query before sending headers so setup failures are still a 500;
+    # rows are then streamed straight from the cursor so memory stays flat
+    stack, cursor = await open_login_attempts_cursor(filters)
+    return StreamingResponse(stream_attempts_json(stack, cursor), media_type="application/json")
 
 @app.get("/api/stats")
+@cache(expire=15)
 async def get_stats_api(username: str = Depends(authenticate)):
     """API endpoint to get dashboard statistics"""
-    stats = get_dashboard_stats()
+    stats = await get_dashboard_stats()
     logger.info("API call: Retrieved dashboard statistics")
     return stats
 
 @app.get("/api/hourly-stats")
+@cache(expire=60, key_builder=hourly_stats_key_builder)
 async def get_hourly_stats_api(days: int = 7, username: str = Depends(authenticate)):
     """API endpoint to get hourly statistics"""
-    stats = get_hourly_stats(days)
+    stats = await get_hourly_stats(days)
     logger.info(f"API call: Retrieved hourly statistics for last {days} days")
     return {"hourly_stats": stats}
 
@@ -312,26 +570,37 @@ async def login_page(request: Request):
     """Login page (for custom authentication if needed)"""
     return templates.TemplateResponse("login.html", {"request": request})
 
+@lru_cache(maxsize=1)
+def health_timestamp(now_second: int) -> str:
+    """ISO timestamp for the health check, formatted once per second"""
+    return datetime.fromtimestamp(now_second).isoformat()
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {"status": "healthy", "timestamp": health_timestamp(time.time_ns() // 1_000_000_000)}
 
 # --- SERVER MANAGEMENT ---
-def start_dashboard_server(host: str = None, port: int = None, debug: bool = False):
+def start_dashboard_server(host: str = None, port: int = None, debug: bool = False, workers: int = None):
     """Start the dashboard server"""
     host = host or DASHBOARD_CONFIG["host"]
     port = port or DASHBOARD_CONFIG["port"]
+    workers = workers or DASHBOARD_CONFIG.get("workers") or max(1, (os.cpu_count() or 1) // 2)
     
     logger.info(f"Starting WiFi Auto Auth Dashboard on http://{host}:{port}")
     logger.info(f"Username: {DASHBOARD_CONFIG['username']}")
     logger.info(f"Password: {DASHBOARD_CONFIG['password']}")
     
+    # Auto-reload only supports a single worker
     uvicorn.run(
         "dashboard:app",
         host=host,
         port=port,
         reload=debug,
+        workers=1 if debug else workers,
+        # uvloop has no Windows support; fall back to the stdlib loop there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level="info"
     )
 
@@ -341,7 +610,8 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="WiFi Auto Auth Dashboard")
     parser.add_argument("--host", default="127.0.0.1", help="Host to bind the server")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind the server")
+    parser.add_argument("--workers", type=int, help="Number of worker processes (default: half the CPU cores)")
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
     
     args = parser.parse_args()
-    start_dashboard_server(args.host, args.port, args.debug)
\ No newline at end of file
+    start_dashboard_server(args.host, args.port, args.debug, args.workers)
\ No newline at end of file